@@ -4,29 +4,30 @@ This module provides configuration options that can be set via
 environment variables or directly in code.
 """
 
-import os
-from typing import Optional
+import envs
 
 # Development mode: Skip real sources and use mock data directly
 # Set CROP_PRICE_DEV_MODE=1 in environment to enable
-DEV_MODE: bool = os.getenv("CROP_PRICE_DEV_MODE", "0").lower() in ("1", "true", "yes")
+DEV_MODE: bool = envs.CROP_PRICE_DEV_MODE
 
 # Request timeout in seconds
-REQUEST_TIMEOUT: int = int(os.getenv("CROP_PRICE_TIMEOUT", "30"))
+REQUEST_TIMEOUT: int = envs.CROP_PRICE_TIMEOUT
 
 # Maximum retry attempts
-MAX_RETRIES: int = int(os.getenv("CROP_PRICE_MAX_RETRIES", "3"))
+MAX_RETRIES: int = envs.CROP_PRICE_MAX_RETRIES
 
 # Retry delay in seconds (base delay, increases with each retry)
-RETRY_DELAY: int = int(os.getenv("CROP_PRICE_RETRY_DELAY", "2"))
+RETRY_DELAY: int = envs.CROP_PRICE_RETRY_DELAY
 
 # Default data source
-DEFAULT_DATA_SOURCE: str = os.getenv("CROP_PRICE_DEFAULT_SOURCE", "agmarknet")
+DEFAULT_DATA_SOURCE: str = envs.CROP_PRICE_DEFAULT_SOURCE
+
+# Use the C-based selectolax (Lexbor) HTML parser when installed.
+# Set CROP_PRICE_USE_SELECTOLAX=0 to force the lxml streaming-parser fallback.
+USE_SELECTOLAX: bool = envs.CROP_PRICE_USE_SELECTOLAX
 
 # Enable/disable mock fallback by default
-DEFAULT_USE_MOCK_FALLBACK: bool = (
-    os.getenv("CROP_PRICE_USE_MOCK_FALLBACK", "1").lower() in ("1", "true", "yes")
-)
+DEFAULT_USE_MOCK_FALLBACK: bool = envs.CROP_PRICE_USE_MOCK_FALLBACK
 
 
 def get_config_summary() -> dict:
@@ -41,5 +42,6 @@ def get_config_summary() -> dict:
         "max_retries": MAX_RETRIES,
         "retry_delay": RETRY_DELAY,
         "default_data_source": DEFAULT_DATA_SOURCE,
+        "use_selectolax": USE_SELECTOLAX,
         "default_use_mock_fallback": DEFAULT_USE_MOCK_FALLBACK,
     }
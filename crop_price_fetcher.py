@@ -5,13 +5,19 @@ structured data that can be used in API responses.
 """
 
 import asyncio
+import functools
 import logging
-import os
+import random
+import sys
+import threading
+import time
+import weakref
 from datetime import date, datetime
 from typing import List, Optional
 
 import aiohttp
-from bs4 import BeautifulSoup
+from lxml import etree
+from pydantic import ValidationError
 
 from exceptions import (
     CropPriceError,
@@ -20,19 +26,56 @@ from exceptions import (
     DataValidationError,
     NetworkError,
 )
-from models import CropPrice, PriceResponse
-
-# Import mock data provider for fallback/demo
+from models import CROP_PRICE_LIST_ADAPTER, CropPrice, PriceResponse
+
+# Import mock data provider for fallback/demo. Mock data is
+# deterministic per (state, district, crop, date), so cache it. Two
+# details keep the cache safe: a None date is resolved to today BEFORE
+# the cache key is formed (resolving it inside the cached call would pin
+# whatever day the entry was first built), and each call hands back a
+# fresh list so callers mutating response.data can't corrupt the cached
+# state — the frozen CropPrice rows themselves stay shared, so the copy
+# is cheap.
 try:
-    from mock_data_provider import get_mock_prices
+    from mock_data_provider import clear_cache as _clear_provider_cache
+    from mock_data_provider import get_mock_prices as _get_mock_prices_impl
 except ImportError:
     get_mock_prices = None
+else:
+
+    @functools.lru_cache(maxsize=1024)
+    def _get_mock_prices_cached(state, district, crop_name, price_date):
+        return tuple(_get_mock_prices_impl(state, district, crop_name, price_date))
+
+    @functools.wraps(_get_mock_prices_impl)
+    def get_mock_prices(state, district=None, crop_name=None, price_date=None):
+        return list(
+            _get_mock_prices_cached(
+                state, district, crop_name, price_date or date.today()
+            )
+        )
 
-# Configure logging
-logging.basicConfig(
-    level=logging.INFO,
-    format="%(asctime)s - %(name)s - %(levelname)s - %(message)s",
-)
+    get_mock_prices.cache_clear = _get_mock_prices_cached.cache_clear
+
+# Optional C-based HTML parser, the fastest option for the
+# DOM-walk-to-extract-a-table workload. Falls back to lxml's streaming
+# HTMLPullParser when not installed.
+try:
+    from selectolax.lexbor import LexborHTMLParser
+except ImportError:
+    LexborHTMLParser = None
+
+# Optional async DNS resolver (requires aiodns). Faster than aiohttp's
+# default thread-pool resolver; falls back to the default when missing.
+# Uses the system's configured nameservers either way.
+try:
+    import aiodns  # noqa: F401
+    from aiohttp.resolver import AsyncResolver
+except ImportError:
+    AsyncResolver = None
+
+# Module logger. Configuring handlers/levels (logging.basicConfig) is
+# left to the application entry point, not done at import time.
 logger = logging.getLogger(__name__)
 
 # Constants
@@ -40,14 +83,224 @@ AGMARKNET_BASE_URL = "http://agmarknet.gov.in"
 AGMARKNET_PRICE_URL = f"{AGMARKNET_BASE_URL}/PriceAndArrivals/CommodityWiseDailyReport.aspx"
 REQUEST_TIMEOUT = 30  # seconds
 MAX_RETRIES = 3
-RETRY_DELAY = 2  # seconds
+RETRY_DELAY = 2  # seconds (base delay for exponential backoff)
+MAX_BACKOFF = 30  # seconds (cap for exponential backoff)
+VIEWSTATE_TTL = 300  # seconds the cached AGMARKNET form tokens stay fresh
+
+# Note: retries must always sleep via asyncio.sleep — never time.sleep,
+# which would block the event loop and stall every concurrent request.
+
+# Import configuration (all env parsing is centralized in envs.py, so
+# there is a single definition of each flag shared with config.py)
+from config import DEV_MODE, USE_SELECTOLAX
+
+# Shared aiohttp sessions, one per event loop, reused across calls so
+# connections (TCP + TLS) and DNS lookups are pooled instead of
+# re-established per request. A session cannot migrate between loops,
+# and loops can coexist (the sync wrapper's thread runs its own loop
+# next to an application loop), so sessions are keyed weakly on their
+# owning loop — each loop sees only its own session and a dead loop's
+# entry falls out of the mapping. The lock only guards mapping mutation
+# from loops running in parallel threads.
+_sessions: "weakref.WeakKeyDictionary[asyncio.AbstractEventLoop, aiohttp.ClientSession]" = (
+    weakref.WeakKeyDictionary()
+)
+_sessions_guard = threading.Lock()
 
-# Import configuration
-try:
-    from config import DEV_MODE
-except ImportError:
-    # Fallback if config.py doesn't exist
-    DEV_MODE = os.getenv("CROP_PRICE_DEV_MODE", "0").lower() in ("1", "true", "yes")
+
+async def _get_session() -> aiohttp.ClientSession:
+    """Get the shared aiohttp ClientSession for the running event loop.
+
+    The session is created on first use and reused for all subsequent
+    requests on the same loop, enabling connection pooling and
+    keep-alive. If the loop's session was closed, a fresh one replaces
+    it; sessions belonging to other loops are never touched.
+
+    Returns:
+        The shared aiohttp.ClientSession bound to the running loop
+    """
+    loop = asyncio.get_running_loop()
+    with _sessions_guard:
+        session = _sessions.get(loop)
+    if session is not None and not session.closed:
+        return session
+
+    # Connector tuned for scraping slow, sometimes IPv6-flaky portals:
+    # cached DNS, a per-host cap so retries can't monopolize the pool,
+    # and a short Happy Eyeballs delay to dodge IPv6 fallback stalls.
+    session = aiohttp.ClientSession(
+        timeout=aiohttp.ClientTimeout(total=REQUEST_TIMEOUT),
+        connector=aiohttp.TCPConnector(
+            limit=200,
+            limit_per_host=10,
+            ttl_dns_cache=300,
+            use_dns_cache=True,
+            happy_eyeballs_delay=0.1,
+            keepalive_timeout=60,
+            enable_cleanup_closed=True,
+            resolver=AsyncResolver() if AsyncResolver is not None else None,
+        ),
+    )
+    with _sessions_guard:
+        _sessions[loop] = session
+    return session
+
+
+async def init_session() -> None:
+    """Eagerly create the shared session for the running event loop.
+
+    Call this from an application startup hook (e.g. a FastAPI startup
+    event) so the first real request doesn't pay for session setup.
+    """
+    await _get_session()
+
+
+async def close_session() -> None:
+    """Close the shared aiohttp session of the running event loop.
+
+    Call this on application shutdown (e.g., from a FastAPI shutdown
+    event) to release pooled connections cleanly. Only the session bound
+    to the current loop is closed, so a shutdown hook on one loop cannot
+    pull a session out from under another loop that is still running.
+    """
+    loop = asyncio.get_running_loop()
+    with _sessions_guard:
+        session = _sessions.pop(loop, None)
+    if session is not None and not session.closed:
+        await session.close()
+
+
+async def _stream_parse_agmarknet(response: aiohttp.ClientResponse) -> tuple:
+    """Incrementally parse an AGMARKNET page while it downloads.
+
+    Instead of materializing the whole page as a string and then building
+    a full tree (bytes + decoded str + tree all live at once), chunks are
+    fed straight into lxml's HTMLPullParser. Only the ASP.NET hidden form
+    fields and the rows of the price grid are kept; everything else is
+    cleared as soon as its end tag is seen, roughly halving peak memory
+    and overlapping network reads with parse CPU.
+
+    Args:
+        response: An open aiohttp response for an AGMARKNET page
+
+    Returns:
+        Tuple of (form_fields, grid_rows) where form_fields maps hidden
+        input ids ("__VIEWSTATE", "__EVENTVALIDATION") to values and
+        grid_rows is a list of tuples of cell text from the price grid
+    """
+    parser = etree.HTMLPullParser(events=("end",))
+    form_fields: dict = {}
+    grid_rows: List[tuple] = []
+
+    async for chunk in response.content.iter_chunked(65536):
+        parser.feed(chunk)
+        for _, elem in parser.read_events():
+            if elem.tag == "input":
+                field_id = elem.get("id")
+                if field_id in ("__VIEWSTATE", "__EVENTVALIDATION"):
+                    form_fields[field_id] = elem.get("value", "")
+                elem.clear()
+            elif elem.tag == "tr":
+                # Keep only rows that belong to the price grid
+                parent = elem.getparent()
+                while parent is not None and parent.tag != "table":
+                    parent = parent.getparent()
+                if parent is not None and parent.get("id") == "gridPriceData":
+                    grid_rows.append(
+                        tuple("".join(td.itertext()).strip() for td in elem.iter("td"))
+                    )
+                elem.clear()
+            else:
+                # Leave cells alone until their enclosing row is done
+                parent = elem.getparent()
+                while parent is not None and parent.tag != "tr":
+                    parent = parent.getparent()
+                if parent is None:
+                    elem.clear()
+
+    parser.close()
+    return form_fields, grid_rows
+
+
+# Cached AGMARKNET hidden form fields as (monotonic timestamp, fields).
+# The tokens stay valid for minutes, so one GET serves many queries.
+# The refresh locks are keyed per event loop, like _sessions: an
+# asyncio.Lock is bound to one loop, and loops in parallel threads must
+# each await their own lock rather than racing over a shared global.
+_viewstate_cache: Optional[tuple] = None
+_viewstate_locks: "weakref.WeakKeyDictionary[asyncio.AbstractEventLoop, asyncio.Lock]" = (
+    weakref.WeakKeyDictionary()
+)
+_viewstate_locks_guard = threading.Lock()
+
+
+def invalidate_viewstate_cache() -> None:
+    """Drop the cached AGMARKNET form tokens.
+
+    Call this when a form submission is rejected (e.g. HTTP 500 or a
+    "viewstate invalid" response) so the next query refetches them.
+    """
+    global _viewstate_cache
+    _viewstate_cache = None
+
+
+async def _get_agmarknet_form_fields() -> dict:
+    """Get the AGMARKNET ASP.NET form tokens, refetching only on expiry.
+
+    __VIEWSTATE and __EVENTVALIDATION don't change per (state, district,
+    crop) query and stay valid for many minutes, so they are cached with
+    a TTL — eliminating one full HTTP round-trip per query after the
+    first. A lock keeps concurrent callers from stampeding the refresh.
+
+    Returns:
+        Dict mapping hidden input ids to their values
+
+    Raises:
+        NetworkError: If the form page can't be fetched
+    """
+    global _viewstate_cache
+
+    cached = _viewstate_cache
+    if cached is not None and time.monotonic() - cached[0] < VIEWSTATE_TTL:
+        return cached[1]
+
+    loop = asyncio.get_running_loop()
+    with _viewstate_locks_guard:
+        lock = _viewstate_locks.get(loop)
+        if lock is None:
+            lock = asyncio.Lock()
+            _viewstate_locks[loop] = lock
+
+    async with lock:
+        # Re-check after acquiring; another task may have refreshed
+        cached = _viewstate_cache
+        if cached is not None and time.monotonic() - cached[0] < VIEWSTATE_TTL:
+            return cached[1]
+
+        session = await _get_session()
+        async with session.get(AGMARKNET_PRICE_URL) as response:
+            if response.status != 200:
+                raise NetworkError(
+                    f"Failed to fetch AGMARKNET page: HTTP {response.status}",
+                    status_code=response.status,
+                )
+
+            if USE_SELECTOLAX and LexborHTMLParser is not None:
+                # Lexbor tokenizes in C but needs the full document
+                html_content = await response.text()
+                tree = LexborHTMLParser(html_content)
+                form_fields = {}
+                for field_id in ("__VIEWSTATE", "__EVENTVALIDATION"):
+                    node = tree.css_first(f"input#{field_id}")
+                    if node is not None:
+                        form_fields[field_id] = node.attributes.get("value") or ""
+            else:
+                # Stream the body straight into an incremental parser so
+                # the full page is never held in memory at once
+                form_fields, _ = await _stream_parse_agmarknet(response)
+
+        _viewstate_cache = (time.monotonic(), form_fields)
+        return form_fields
 
 
 async def fetch_agmarknet_prices(
@@ -78,42 +331,36 @@ async def fetch_agmarknet_prices(
     if price_date is None:
         price_date = date.today()
 
-    logger.info(f"Fetching prices from AGMARKNET for state={state}, district={district}, crop={crop_name}")
+    logger.info("Fetching prices from AGMARKNET for state=%s, district=%s, crop=%s", state, district, crop_name)
 
     # AGMARKNET requires form submission with specific parameters
     # Note: This is a simplified implementation. Real implementation may need
     # to handle state/district/crop dropdowns and form submission
     try:
-        async with aiohttp.ClientSession(timeout=aiohttp.ClientTimeout(total=REQUEST_TIMEOUT)) as session:
-            # First, get the page to extract viewstate and other form data
-            async with session.get(AGMARKNET_PRICE_URL) as response:
-                if response.status != 200:
-                    raise NetworkError(
-                        f"Failed to fetch AGMARKNET page: HTTP {response.status}",
-                        status_code=response.status,
-                    )
-
-                html_content = await response.text()
-                soup = BeautifulSoup(html_content, "html.parser")
-
-                # Extract form data (viewstate, event validation, etc.)
-                # This is a placeholder - actual implementation needs to parse the form
-                # and submit with proper state/district/crop selections
-
-                # For now, return a mock structure showing the expected format
-                # In production, you would parse the actual HTML table from AGMARKNET
-                logger.warning(
-                    "AGMARKNET scraping requires form submission. "
-                    "This is a template - implement actual form handling."
-                )
+        # Hidden form tokens are cached with a TTL, so this usually costs
+        # nothing; only the first query (or an expired cache) pays the GET
+        form_fields = await _get_agmarknet_form_fields()
+
+        # This is a placeholder - actual implementation needs to POST the
+        # form with proper state/district/crop selections plus the cached
+        # form_fields, then stream-parse the response grid. On a
+        # viewstate-rejection response, call invalidate_viewstate_cache()
+        # and retry once.
+
+        # For now, return a mock structure showing the expected format
+        # In production, you would parse the actual HTML table from AGMARKNET
+        logger.warning(
+            "AGMARKNET scraping requires form submission. "
+            "This is a template - implement actual form handling."
+        )
 
-                # Mock data structure for demonstration
-                # Replace this with actual scraping logic
-                raise DataSourceError(
-                    "AGMARKNET form submission not fully implemented. "
-                    "Use alternative data source or implement form handling.",
-                    source="agmarknet",
-                )
+        # Mock data structure for demonstration
+        # Replace this with actual scraping logic
+        raise DataSourceError(
+            "AGMARKNET form submission not fully implemented. "
+            "Use alternative data source or implement form handling.",
+            source="agmarknet",
+        )
 
     except aiohttp.ClientError as e:
         raise NetworkError(f"Network error while fetching from AGMARKNET: {str(e)}") from e
@@ -146,34 +393,34 @@ async def fetch_enam_prices(
         DataNotFoundError: If no data is found for the given parameters
         DataSourceError: If there's an error parsing or accessing the data source
     """
-    logger.info(f"Fetching prices from e-NAM for state={state}, district={district}, crop={crop_name}")
+    logger.info("Fetching prices from e-NAM for state=%s, district=%s, crop=%s", state, district, crop_name)
 
     enam_base_url = "https://enam.gov.in"
     enam_price_url = f"{enam_base_url}/web/dashboard/live_price"
 
     try:
-        async with aiohttp.ClientSession(timeout=aiohttp.ClientTimeout(total=REQUEST_TIMEOUT)) as session:
-            # e-NAM may require API calls or form submissions
-            # This is a placeholder for the actual implementation
-            async with session.get(enam_price_url) as response:
-                if response.status != 200:
-                    raise NetworkError(
-                        f"Failed to fetch e-NAM page: HTTP {response.status}",
-                        status_code=response.status,
-                    )
-
-                # Parse response and extract price data
-                # Actual implementation would parse JSON or HTML response
-                logger.warning(
-                    "e-NAM API integration requires authentication or specific endpoints. "
-                    "This is a template - implement actual API calls."
+        session = await _get_session()
+        # e-NAM may require API calls or form submissions
+        # This is a placeholder for the actual implementation
+        async with session.get(enam_price_url) as response:
+            if response.status != 200:
+                raise NetworkError(
+                    f"Failed to fetch e-NAM page: HTTP {response.status}",
+                    status_code=response.status,
                 )
 
-                raise DataSourceError(
-                    "e-NAM API integration not fully implemented. "
-                    "Use alternative data source or implement API authentication.",
-                    source="enam",
-                )
+            # Parse response and extract price data
+            # Actual implementation would parse JSON or HTML response
+            logger.warning(
+                "e-NAM API integration requires authentication or specific endpoints. "
+                "This is a template - implement actual API calls."
+            )
+
+            raise DataSourceError(
+                "e-NAM API integration not fully implemented. "
+                "Use alternative data source or implement API authentication.",
+                source="enam",
+            )
 
     except aiohttp.ClientError as e:
         raise NetworkError(f"Network error while fetching from e-NAM: {str(e)}") from e
@@ -183,11 +430,17 @@ async def fetch_enam_prices(
         raise DataSourceError(f"Unexpected error fetching from e-NAM: {str(e)}", source="enam") from e
 
 
+# String fields that repeat heavily across rows of one response (a full
+# state's rows share a handful of districts, markets, and crop names).
+_INTERN_FIELDS = ("state", "district", "market_name", "crop_name")
+
+
 def parse_price_data(raw_data: List[dict]) -> List[CropPrice]:
     """Parse raw price data into CropPrice objects.
 
     This function validates and converts raw dictionary data into
-    structured CropPrice Pydantic models.
+    structured CropPrice Pydantic models, validating the whole batch in
+    a single call.
 
     Args:
         raw_data: List of dictionaries containing raw price data
@@ -198,17 +451,198 @@ def parse_price_data(raw_data: List[dict]) -> List[CropPrice]:
     Raises:
         DataValidationError: If data validation fails
     """
-    prices = []
+    # Intern the heavily repeated strings so the hundreds of rows in a
+    # state-wide batch share one object per distinct value; interned
+    # strings also make the filter comparisons pointer-fast.
+    dedup: dict = {}
     for item in raw_data:
-        try:
-            # Validate and create CropPrice object
-            price = CropPrice(**item)
-            prices.append(price)
-        except Exception as e:
-            logger.warning(f"Failed to parse price data item: {item}. Error: {str(e)}")
-            raise DataValidationError(f"Invalid price data format: {str(e)}") from e
+        for key in _INTERN_FIELDS:
+            value = item.get(key)
+            if type(value) is str:
+                item[key] = dedup.setdefault(value, sys.intern(value))
+
+    try:
+        return CROP_PRICE_LIST_ADAPTER.validate_python(raw_data)
+    except ValidationError as e:
+        logger.warning("Invalid price batch: %s", e.errors()[:3])
+        raise DataValidationError(f"Invalid price data format: {str(e)}") from e
+
+
+async def _fetch_from_source(
+    data_source: str,
+    state: str,
+    district: Optional[str] = None,
+    crop_name: Optional[str] = None,
+    price_date: Optional[date] = None,
+) -> List[CropPrice]:
+    """Dispatch a price fetch to the named data source.
+
+    Args:
+        data_source: Data source to use ("agmarknet" or "enam")
+        state: Name of the state
+        district: Optional district name for filtering
+        crop_name: Optional crop name for filtering
+        price_date: Optional date for price data
+
+    Returns:
+        List of CropPrice objects from the source
+
+    Raises:
+        ValueError: If the data source is not recognized
+    """
+    source = data_source.lower()
+    if source == "agmarknet":
+        return await fetch_agmarknet_prices(state, district, crop_name, price_date)
+    if source == "enam":
+        return await fetch_enam_prices(state, district, crop_name)
+    raise ValueError(f"Unknown data source: {data_source}")
+
+
+async def _race_sources(
+    state: str,
+    district: Optional[str] = None,
+    crop_name: Optional[str] = None,
+    price_date: Optional[date] = None,
+) -> tuple:
+    """Fetch from both data sources concurrently, keeping the first result.
+
+    Both sources are independent I/O, so instead of retrying the primary
+    and only then trying the fallback, this races them and returns as
+    soon as one yields data. The slower task is cancelled.
+
+    Args:
+        state: Name of the state
+        district: Optional district name for filtering
+        crop_name: Optional crop name for filtering
+        price_date: Optional date for price data
+
+    Returns:
+        Tuple of (prices, last_error) where prices is the first non-empty
+        result (or an empty list) and last_error is the most recent
+        source failure (or None)
+    """
+    pending = {
+        asyncio.create_task(
+            _fetch_from_source("agmarknet", state, district, crop_name, price_date)
+        ),
+        asyncio.create_task(
+            _fetch_from_source("enam", state, district, crop_name, price_date)
+        ),
+    }
+    last_error: Optional[Exception] = None
+
+    try:
+        while pending:
+            done, pending = await asyncio.wait(pending, return_when=asyncio.FIRST_COMPLETED)
+            for task in done:
+                try:
+                    prices = task.result()
+                except (NetworkError, DataSourceError) as e:
+                    logger.warning("Source failed during race: %s", e)
+                    last_error = e
+                    continue
+                except Exception as e:
+                    # Wrap unexpected errors the same way the sequential
+                    # retry path does, so both modes surface identically
+                    logger.error("Unexpected error: %s", e)
+                    raise CropPriceError(
+                        f"Unexpected error fetching prices: {str(e)}"
+                    ) from e
+                if prices:
+                    return prices, last_error
+    finally:
+        for task in pending:
+            task.cancel()
+        if pending:
+            # Reap the cancelled losers so a failure that lands before
+            # the cancellation never logs "exception was never retrieved"
+            await asyncio.gather(*pending, return_exceptions=True)
+
+    return [], last_error
+
+
+def _build_response(
+    success: bool,
+    prices: List[CropPrice],
+    state: str,
+    district: Optional[str],
+    crop_name: Optional[str],
+    message: str,
+) -> PriceResponse:
+    """Build a PriceResponse from already-validated data.
+
+    Every input here comes from our own validated paths (parse_price_data
+    or the mock provider), so PriceResponse.model_construct can skip
+    validator dispatch entirely. The clock is read exactly once here
+    rather than via a per-instantiation default factory on the model.
+
+    Args:
+        success: Whether the request was successful
+        prices: Validated list of CropPrice objects
+        state: State for which prices were fetched
+        district: District filter applied (if any)
+        crop_name: Crop filter applied (if any)
+        message: Message or error description
+
+    Returns:
+        PriceResponse object containing the prices and metadata
+    """
+    return PriceResponse.model_construct(
+        success=success,
+        data=prices,
+        count=len(prices),
+        state=state,
+        district=district,
+        crop_name=crop_name,
+        fetched_at=datetime.now(),
+        message=message,
+    )
 
-    return prices
+
+@functools.lru_cache(maxsize=2048)
+def _norm(s: Optional[str]) -> Optional[str]:
+    """Normalize a query string to stripped Title Case, with caching.
+
+    Real traffic uses a small vocabulary of states/districts/crops, so
+    the strip+title allocations are paid once per distinct input. The
+    result is interned so repeated queries share one str object with the
+    (also interned) row fields, keeping downstream == on the pointer
+    fast path.
+    """
+    return sys.intern(s.strip().title()) if s else s
+
+
+def _filter_prices(
+    prices: List[CropPrice],
+    district: Optional[str] = None,
+    crop_name: Optional[str] = None,
+) -> List[CropPrice]:
+    """Filter prices by district and/or crop name, case-insensitively.
+
+    The query strings are casefolded once up front (title-casing is kept
+    purely for display in the response) and both filters are applied in
+    a single pass, so large result sets are only walked once.
+
+    Args:
+        prices: List of CropPrice objects to filter
+        district: Optional district name filter
+        crop_name: Optional crop name filter
+
+    Returns:
+        Filtered list of CropPrice objects
+    """
+    district_cf = district.casefold() if district else None
+    crop_cf = crop_name.casefold() if crop_name else None
+
+    if district_cf is None and crop_cf is None:
+        return prices
+
+    return [
+        p
+        for p in prices
+        if (district_cf is None or p.district.casefold() == district_cf)
+        and (crop_cf is None or p.crop_name.casefold() == crop_cf)
+    ]
 
 
 async def get_crop_prices(
@@ -219,6 +653,7 @@ async def get_crop_prices(
     data_source: str = "agmarknet",
     use_mock_fallback: bool = True,
     use_mock_only: Optional[bool] = None,
+    race_sources: bool = False,
 ) -> PriceResponse:
     """Fetch crop prices from specified data source.
 
@@ -233,6 +668,8 @@ async def get_crop_prices(
         data_source: Data source to use ("agmarknet" or "enam", default: "agmarknet")
         use_mock_fallback: Use mock data if real sources fail (default: True)
         use_mock_only: Skip real sources and use mock data directly (default: None, uses DEV_MODE env var)
+        race_sources: Fetch from both sources concurrently and use the first
+            non-empty result instead of retrying the primary first (default: False)
 
     Returns:
         PriceResponse object containing fetched prices and metadata
@@ -241,15 +678,15 @@ async def get_crop_prices(
         CropPriceError: Base exception for all crop price related errors
         DataNotFoundError: If no data is found for the given parameters
     """
-    # Input validation
-    if not state or not state.strip():
+    # Input validation and normalization (cached per distinct input)
+    state = _norm(state)
+    if not state:
         raise ValueError("State parameter is required and cannot be empty")
+    district = _norm(district)
+    crop_name = _norm(crop_name)
 
-    state = state.strip().title()
-    if district:
-        district = district.strip().title()
-    if crop_name:
-        crop_name = crop_name.strip().title()
+    # Lowercase the source name once; dispatch and fallback reuse it
+    data_source = data_source.lower()
 
     # Determine if we should use mock data only
     if use_mock_only is None:
@@ -259,98 +696,90 @@ async def get_crop_prices(
         logger.info("Development mode: Using mock data directly (skipping real sources)")
         if get_mock_prices:
             try:
+                # The provider filters at the source, before constructing
+                # CropPrice objects, so no second filter pass is needed
                 prices = get_mock_prices(state, district, crop_name, price_date)
                 if prices:
-                    # Filter by district and crop if specified
-                    if district:
-                        prices = [p for p in prices if p.district.lower() == district.lower()]
-                    if crop_name:
-                        prices = [p for p in prices if p.crop_name.lower() == crop_name.lower()]
-
-                    return PriceResponse(
-                        success=True,
-                        data=prices,
-                        count=len(prices),
-                        state=state,
-                        district=district,
-                        crop_name=crop_name,
-                        message=f"Successfully fetched {len(prices)} mock price entries (dev mode)",
+                    return _build_response(
+                        True,
+                        prices,
+                        state,
+                        district,
+                        crop_name,
+                        f"Successfully fetched {len(prices)} mock price entries (dev mode)",
                     )
             except Exception as e:
-                logger.error(f"Mock data provider failed: {str(e)}")
-
-        return PriceResponse(
-            success=False,
-            data=[],
-            count=0,
-            state=state,
-            district=district,
-            crop_name=crop_name,
-            message="Mock data provider unavailable",
+                logger.error("Mock data provider failed: %s", e)
+
+        return _build_response(
+            False, [], state, district, crop_name, "Mock data provider unavailable"
         )
 
     logger.info(
-        f"Fetching crop prices: state={state}, district={district}, "
-        f"crop={crop_name}, source={data_source}"
+        "Fetching crop prices: state=%s, district=%s, crop=%s, source=%s",
+        state, district, crop_name, data_source,
     )
 
     # Try fetching from primary source with retries
     prices: List[CropPrice] = []
     last_error: Optional[Exception] = None
 
-    for attempt in range(MAX_RETRIES):
-        try:
-            if data_source.lower() == "agmarknet":
-                prices = await fetch_agmarknet_prices(state, district, crop_name, price_date)
-            elif data_source.lower() == "enam":
-                prices = await fetch_enam_prices(state, district, crop_name)
-            else:
-                raise ValueError(f"Unknown data source: {data_source}")
+    if race_sources:
+        # Race both sources concurrently; both have already been tried
+        # when this returns, so no retry/fallback pass is needed
+        prices, last_error = await _race_sources(state, district, crop_name, price_date)
+    else:
+        for attempt in range(MAX_RETRIES):
+            try:
+                prices = await _fetch_from_source(
+                    data_source, state, district, crop_name, price_date
+                )
 
-            # If we got prices, break out of retry loop
-            if prices:
-                break
+                # If we got prices, break out of retry loop
+                if prices:
+                    break
+
+            except (NetworkError, DataSourceError) as e:
+                last_error = e
+                if attempt < MAX_RETRIES - 1:
+                    logger.warning("Attempt %d failed: %s. Retrying...", attempt + 1, e)
+                    # Capped exponential backoff with jitter, so concurrent
+                    # clients don't retry in lockstep against the same source
+                    delay = min(MAX_BACKOFF, RETRY_DELAY * (2 ** attempt))
+                    await asyncio.sleep(delay * (0.5 + random.random() * 0.5))
+                else:
+                    logger.error("All %d attempts failed: %s", MAX_RETRIES, e)
 
-        except (NetworkError, DataSourceError) as e:
-            last_error = e
-            if attempt < MAX_RETRIES - 1:
-                logger.warning(f"Attempt {attempt + 1} failed: {str(e)}. Retrying...")
-                await asyncio.sleep(RETRY_DELAY * (attempt + 1))  # Exponential backoff
-            else:
-                logger.error(f"All {MAX_RETRIES} attempts failed: {str(e)}")
+            except Exception as e:
+                logger.error("Unexpected error: %s", e)
+                raise CropPriceError(f"Unexpected error fetching prices: {str(e)}") from e
 
-        except Exception as e:
-            logger.error(f"Unexpected error: {str(e)}")
-            raise CropPriceError(f"Unexpected error fetching prices: {str(e)}") from e
+        # If no prices found after retries, try fallback source
+        if not prices and last_error:
+            logger.info("Primary source failed, trying fallback...")
+            try:
+                fallback_source = "enam" if data_source == "agmarknet" else "agmarknet"
+                prices = await _fetch_from_source(
+                    fallback_source, state, district, crop_name, price_date
+                )
+            except Exception as e:
+                logger.error("Fallback source also failed: %s", e)
 
-    # If no prices found after retries, try fallback source
-    if not prices and last_error:
-        logger.info(f"Primary source failed, trying fallback...")
-        try:
-            fallback_source = "enam" if data_source.lower() == "agmarknet" else "agmarknet"
-            if fallback_source == "agmarknet":
-                prices = await fetch_agmarknet_prices(state, district, crop_name, price_date)
-            else:
-                prices = await fetch_enam_prices(state, district, crop_name)
-        except Exception as e:
-            logger.error(f"Fallback source also failed: {str(e)}")
+    # Filter real-source results by district and crop if specified
+    if prices:
+        prices = _filter_prices(prices, district, crop_name)
 
-    # If still no prices and mock fallback is enabled, use mock data
+    # If still no prices and mock fallback is enabled, use mock data.
+    # The provider filters at the source, so its output needs no second
+    # filter pass.
     if not prices and use_mock_fallback and get_mock_prices:
         logger.warning("All data sources failed, using mock data for demonstration")
         try:
             prices = get_mock_prices(state, district, crop_name, price_date)
             if prices:
-                logger.info(f"Using {len(prices)} mock price entries")
+                logger.info("Using %d mock price entries", len(prices))
         except Exception as e:
-            logger.error(f"Mock data provider also failed: {str(e)}")
-
-    # Filter by district and crop if specified
-    if prices:
-        if district:
-            prices = [p for p in prices if p.district.lower() == district.lower()]
-        if crop_name:
-            prices = [p for p in prices if p.crop_name.lower() == crop_name.lower()]
+            logger.error("Mock data provider also failed: %s", e)
 
     # Build response
     if not prices:
@@ -362,24 +791,10 @@ async def get_crop_prices(
         if last_error:
             message += f". Last error: {str(last_error)}"
 
-        return PriceResponse(
-            success=False,
-            data=[],
-            count=0,
-            state=state,
-            district=district,
-            crop_name=crop_name,
-            message=message,
-        )
+        return _build_response(False, [], state, district, crop_name, message)
 
-    return PriceResponse(
-        success=True,
-        data=prices,
-        count=len(prices),
-        state=state,
-        district=district,
-        crop_name=crop_name,
-        message=f"Successfully fetched {len(prices)} price entries",
+    return _build_response(
+        True, prices, state, district, crop_name, f"Successfully fetched {len(prices)} price entries"
     )
 
 
@@ -392,11 +807,13 @@ def get_crop_prices_sync(
     data_source: str = "agmarknet",
     use_mock_fallback: bool = True,
     use_mock_only: Optional[bool] = None,
+    race_sources: bool = False,
 ) -> PriceResponse:
     """Synchronous wrapper for get_crop_prices.
 
-    This function runs the async get_crop_prices in an event loop.
-    Use this if you're not in an async context.
+    This function runs the async get_crop_prices via asyncio.run, which
+    creates a fresh event loop and cleans it up on completion. Use this
+    if you're not in an async context.
 
     Args:
         state: Name of the state (required)
@@ -407,15 +824,100 @@ def get_crop_prices_sync(
 
     Returns:
         PriceResponse object containing fetched prices and metadata
+
+    Raises:
+        RuntimeError: If called from within a running event loop
     """
     try:
-        loop = asyncio.get_event_loop()
+        asyncio.get_running_loop()
     except RuntimeError:
-        loop = asyncio.new_event_loop()
-        asyncio.set_event_loop(loop)
-
-    return loop.run_until_complete(
-        get_crop_prices(
-            state, district, crop_name, price_date, data_source, use_mock_fallback, use_mock_only
+        pass
+    else:
+        raise RuntimeError(
+            "get_crop_prices_sync cannot be called from a running event loop; "
+            "use 'await get_crop_prices(...)' instead"
         )
+
+    async def _run() -> PriceResponse:
+        try:
+            return await get_crop_prices(
+                state,
+                district,
+                crop_name,
+                price_date,
+                data_source,
+                use_mock_fallback,
+                use_mock_only,
+                race_sources,
+            )
+        finally:
+            # The loop created by asyncio.run closes on return, so shut
+            # down the shared session cleanly while it is still running
+            await close_session()
+
+    return asyncio.run(_run())
+
+
+@functools.lru_cache(maxsize=128)
+def _mock_json_bytes(
+    state: str,
+    district: Optional[str],
+    crop_name: Optional[str],
+    price_date: date,
+) -> bytes:
+    """Serialize the mock prices for one query key and cache the bytes."""
+    return CROP_PRICE_LIST_ADAPTER.dump_json(
+        get_mock_prices(state, district, crop_name, price_date)
     )
+
+
+def clear_mock_caches() -> None:
+    """Clear every cache layer derived from the mock dataset.
+
+    Three layers memoize mock data: the provider's own row cache, this
+    module's lru_cache around get_mock_prices, and the serialized JSON
+    bytes cache. Clearing only one of them keeps serving the old data,
+    so after changing the mock dataset call this to drop all three.
+    """
+    if get_mock_prices is not None:
+        get_mock_prices.cache_clear()
+        _clear_provider_cache()
+    _mock_json_bytes.cache_clear()
+
+
+def get_crop_prices_json_bytes(
+    state: str,
+    district: Optional[str] = None,
+    crop_name: Optional[str] = None,
+    price_date: Optional[date] = None,
+) -> bytes:
+    """Get pre-serialized JSON bytes for the dev-mode mock prices.
+
+    Identical queries produce identical JSON, so the serialized bytes are
+    cached per (state, district, crop, date) — repeat dev-mode calls skip
+    both validation and serialization. A web layer can return the bytes
+    directly, e.g. ``Response(content=..., media_type="application/json")``.
+
+    Args:
+        state: Name of the state (required)
+        district: Optional district name for filtering
+        crop_name: Optional crop name for filtering
+        price_date: Optional date for price data (defaults to today)
+
+    Returns:
+        JSON-encoded bytes for the list of matching mock prices
+
+    Raises:
+        CropPriceError: If the mock data provider is unavailable
+        ValueError: If state is empty
+    """
+    if get_mock_prices is None:
+        raise CropPriceError("Mock data provider is not available")
+
+    state = _norm(state)
+    if not state:
+        raise ValueError("State parameter is required and cannot be empty")
+    if price_date is None:
+        price_date = date.today()
+
+    return _mock_json_bytes(state, _norm(district), _norm(crop_name), price_date)
@@ -0,0 +1,64 @@
+"""Centralized environment-variable parsing for the crop price module.
+
+All environment reads go through this module so each variable is parsed
+exactly once (lazily, on first access) and every consumer sees the same
+value. Access variables as attributes, e.g. ``envs.CROP_PRICE_DEV_MODE``.
+"""
+
+import os
+from typing import Any, Callable, Dict
+
+# Truthy values for boolean flags; frozenset lookup beats a tuple scan.
+_TRUTHY = frozenset({"1", "true", "yes", "on"})
+
+
+def _envbool(name: str, default: bool = False) -> bool:
+    """Parse a boolean environment variable against the truthy set.
+
+    Unset variables short-circuit to the default without allocating a
+    fallback string or lowercasing anything.
+    """
+    v = os.environ.get(name)
+    return default if v is None else v.lower() in _TRUTHY
+
+
+# Parser for each supported environment variable. Parsing is deferred
+# until first attribute access, so unset variables cost nothing beyond
+# a single dict lookup.
+environment_variables: Dict[str, Callable[[], Any]] = {
+    # Development mode: skip real sources and use mock data directly
+    "CROP_PRICE_DEV_MODE": lambda: _envbool("CROP_PRICE_DEV_MODE"),
+    # Request timeout in seconds
+    "CROP_PRICE_TIMEOUT": lambda: int(os.environ.get("CROP_PRICE_TIMEOUT", "30")),
+    # Maximum retry attempts
+    "CROP_PRICE_MAX_RETRIES": lambda: int(os.environ.get("CROP_PRICE_MAX_RETRIES", "3")),
+    # Retry delay in seconds (base delay, increases with each retry)
+    "CROP_PRICE_RETRY_DELAY": lambda: int(os.environ.get("CROP_PRICE_RETRY_DELAY", "2")),
+    # Default data source
+    "CROP_PRICE_DEFAULT_SOURCE": lambda: os.environ.get("CROP_PRICE_DEFAULT_SOURCE", "agmarknet"),
+    # Use the C-based selectolax (Lexbor) HTML parser when installed
+    "CROP_PRICE_USE_SELECTOLAX": lambda: _envbool("CROP_PRICE_USE_SELECTOLAX", default=True),
+    # Enable/disable mock fallback by default
+    "CROP_PRICE_USE_MOCK_FALLBACK": lambda: _envbool("CROP_PRICE_USE_MOCK_FALLBACK", default=True),
+}
+
+# Cache of parsed values, keyed by variable name.
+_cache: Dict[str, Any] = {}
+
+
+def __getattr__(name: str) -> Any:
+    """Lazily parse and cache the named environment variable."""
+    if name in _cache:
+        return _cache[name]
+    try:
+        parser = environment_variables[name]
+    except KeyError:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}") from None
+    value = parser()
+    _cache[name] = value
+    return value
+
+
+def __dir__() -> list:
+    """List the supported environment variables."""
+    return list(environment_variables)
@@ -10,6 +10,20 @@ from datetime import date
 
 from crop_price_fetcher import get_crop_prices, get_crop_prices_sync
 
+# Use orjson for serialization when installed (3-10x faster than stdlib
+# json for numeric-heavy payloads); fall back to stdlib json otherwise.
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+
+def dumps_indented(obj) -> str:
+    """Serialize to indented JSON, preferring orjson when available."""
+    if orjson is not None:
+        return orjson.dumps(obj, option=orjson.OPT_INDENT_2).decode()
+    return json.dumps(obj, indent=2, default=str)
+
 
 def print_price_response(response):
     """Pretty print a PriceResponse object."""
@@ -81,9 +95,9 @@ def example_json_output():
         state="Delhi", district="North Delhi", crop_name="Wheat", use_mock_only=True
     )
 
-    # Convert to dict and then to JSON for clean output
-    response_dict = response.model_dump()
-    json_output = json.dumps(response_dict, indent=2, default=str)
+    # Convert to dict (JSON mode, so dates become strings) and serialize
+    response_dict = response.model_dump(mode="json")
+    json_output = dumps_indented(response_dict)
 
     print(json_output)
 
@@ -100,10 +114,18 @@ def example_json_output():
             }
             for p in response.data
         ]
-        print(json.dumps(filtered_data, indent=2))
+        print(dumps_indented(filtered_data))
 
 
 if __name__ == "__main__":
+    import logging
+
+    # Logging is configured here (the entry point), not at module import
+    logging.basicConfig(
+        level=logging.INFO,
+        format="%(asctime)s - %(name)s - %(levelname)s - %(message)s",
+    )
+
     print("Crop Price Fetcher - Example Usage")
     print("=" * 80)
 
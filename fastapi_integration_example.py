@@ -9,18 +9,58 @@ from typing import Optional
 
 from fastapi import FastAPI, HTTPException, Query, status
 from fastapi.middleware.cors import CORSMiddleware
-from fastapi.responses import JSONResponse
-
-from crop_price_fetcher import get_crop_prices
+from fastapi.responses import JSONResponse, ORJSONResponse
+
+from crop_price_fetcher import (
+    clear_mock_caches,
+    close_session,
+    get_crop_prices,
+    get_mock_prices,
+    init_session,
+)
 from exceptions import CropPriceError, DataNotFoundError, NetworkError
 from models import PriceResponse
 
-# Initialize FastAPI app
+# Initialize FastAPI app. ORJSONResponse serializes with the C-based
+# orjson library, which is several times faster than stdlib json for
+# numeric-heavy payloads like price tables.
 app = FastAPI(
     title="Krishi Shayak - Crop Prices API",
     description="API for fetching live mandi crop prices",
     version="1.0.0",
+    default_response_class=ORJSONResponse,
+)
+
+# Catalog data for the list endpoints. In production these would come
+# from a database; as constants they are built once at import instead of
+# re-allocating a list (and recomputing its length) per request.
+_STATES = (
+    "Delhi",
+    "Punjab",
+    "Maharashtra",
+    "Tamil Nadu",
+    "Karnataka",
+    "Gujarat",
+    "Rajasthan",
+    "Uttar Pradesh",
+    "Haryana",
+    "West Bengal",
 )
+_STATES_RESPONSE = {"states": _STATES, "count": len(_STATES)}
+
+_CROPS = (
+    "Wheat",
+    "Rice",
+    "Tomato",
+    "Potato",
+    "Onion",
+    "Cotton",
+    "Sugarcane",
+    "Turmeric",
+    "Maize",
+    "Soybean",
+)
+_CROPS_BASE = {"crops": _CROPS, "count": len(_CROPS)}
 
 # Configure CORS (adjust for production)
 app.add_middleware(
@@ -32,6 +72,18 @@ app.add_middleware(
 )
 
 
+@app.on_event("startup")
+async def startup_event():
+    """Prime the shared aiohttp session so the first request doesn't pay for it."""
+    await init_session()
+
+
+@app.on_event("shutdown")
+async def shutdown_event():
+    """Close the shared aiohttp session and release pooled connections."""
+    await close_session()
+
+
 @app.get("/", tags=["Health"])
 async def root():
     """Root endpoint for health check."""
@@ -132,20 +184,7 @@ async def fetch_crop_prices(
 )
 async def list_states():
     """List available states (example implementation)."""
-    # In production, this could query your database or data source
-    states = [
-        "Delhi",
-        "Punjab",
-        "Maharashtra",
-        "Tamil Nadu",
-        "Karnataka",
-        "Gujarat",
-        "Rajasthan",
-        "Uttar Pradesh",
-        "Haryana",
-        "West Bengal",
-    ]
-    return {"states": states, "count": len(states)}
+    return _STATES_RESPONSE
 
 
 @app.get(
@@ -156,20 +195,24 @@ async def list_states():
 )
 async def list_crops(state: Optional[str] = Query(None, description="Filter by state")):
     """List available crops (example implementation)."""
-    # In production, this could query your database or data source
-    crops = [
-        "Wheat",
-        "Rice",
-        "Tomato",
-        "Potato",
-        "Onion",
-        "Cotton",
-        "Sugarcane",
-        "Turmeric",
-        "Maize",
-        "Soybean",
-    ]
-    return {"crops": crops, "count": len(crops), "state": state}
+    return {**_CROPS_BASE, "state": state}
+
+
+@app.post(
+    "/api/v1/admin/mock-cache/clear",
+    tags=["Admin"],
+    summary="Clear the mock price cache",
+    description="Clear cached mock price data (useful after changing the mock dataset).",
+)
+async def clear_mock_cache():
+    """Clear every cache layer built over the mock dataset."""
+    if get_mock_prices is None:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail="Mock data provider is not available",
+        )
+    clear_mock_caches()
+    return {"message": "Mock price caches cleared"}
 
 
 # Error handler for validation errors
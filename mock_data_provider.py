@@ -4,12 +4,205 @@ This module provides sample crop price data that can be used for development
 and testing when real data sources are unavailable or rate-limited.
 """
 
+import sys
 from datetime import date, timedelta
-from typing import List, Optional
+from functools import lru_cache
+from typing import List, NamedTuple, Optional, Tuple
 
 from models import CropPrice
 
 
+class _MockRow(NamedTuple):
+    """One mock price row, with precomputed lowercased filter keys."""
+
+    crop_name: str
+    min_price: float
+    max_price: float
+    modal_price: float
+    market_name: str
+    district: str
+    state: str
+    state_lc: str
+    district_lc: str
+    crop_lc: str
+    kwargs: dict
+
+
+def _row(
+    crop_name: str,
+    min_price: float,
+    max_price: float,
+    modal_price: float,
+    market_name: str,
+    district: str,
+    state: str,
+) -> _MockRow:
+    """Build a _MockRow with interned strings and lowercased keys.
+
+    The model_construct argument dict (everything except price_date) is
+    pre-bound here so the query-time build loop is a single dict-unpack
+    per row instead of re-binding every keyword on every call.
+    """
+    crop_name = sys.intern(crop_name)
+    market_name = sys.intern(market_name)
+    district = sys.intern(district)
+    state = sys.intern(state)
+    return _MockRow(
+        crop_name,
+        min_price,
+        max_price,
+        modal_price,
+        market_name,
+        district,
+        state,
+        state.lower(),
+        district.lower(),
+        crop_name.lower(),
+        {
+            "crop_name": crop_name,
+            "min_price": min_price,
+            "max_price": max_price,
+            "modal_price": modal_price,
+            "market_name": market_name,
+            "district": district,
+            "state": state,
+        },
+    )
+
+
+# Sample crop data with realistic Indian mandi prices (per quintal).
+# Built once at import time; get_mock_prices only scans it.
+_ALL_CROPS = (
+    _row("Wheat", 2100.0, 2300.0, 2200.0, "Azadpur Mandi", "North Delhi", "Delhi"),
+    _row("Rice", 1800.0, 2000.0, 1900.0, "Azadpur Mandi", "North Delhi", "Delhi"),
+    _row("Tomato", 1200.0, 1500.0, 1350.0, "Azadpur Mandi", "North Delhi", "Delhi"),
+    _row("Potato", 800.0, 1000.0, 900.0, "Azadpur Mandi", "North Delhi", "Delhi"),
+    _row("Onion", 1500.0, 1800.0, 1650.0, "Azadpur Mandi", "North Delhi", "Delhi"),
+    _row("Wheat", 2050.0, 2250.0, 2150.0, "Khanna Mandi", "Ludhiana", "Punjab"),
+    _row("Rice", 1750.0, 1950.0, 1850.0, "Khanna Mandi", "Ludhiana", "Punjab"),
+    _row("Cotton", 5500.0, 6000.0, 5750.0, "Yavatmal Mandi", "Yavatmal", "Maharashtra"),
+    _row("Sugarcane", 280.0, 320.0, 300.0, "Kolhapur Mandi", "Kolhapur", "Maharashtra"),
+    _row("Turmeric", 12000.0, 14000.0, 13000.0, "Erode Mandi", "Erode", "Tamil Nadu"),
+)
+
+# Indices over the dataset, built once at import. Lookups pick the most
+# selective index for the supplied filters and only apply any residual
+# predicate to the (much shorter) shortlist; an absent key returns an
+# empty shortlist without scanning anything.
+_BY_STATE: dict = {}
+_BY_STATE_CROP: dict = {}
+for _r in _ALL_CROPS:
+    _BY_STATE.setdefault(_r.state_lc, []).append(_r)
+    _BY_STATE_CROP.setdefault((_r.state_lc, _r.crop_lc), []).append(_r)
+del _r
+
+# Optional vectorized filter path for large datasets. The bundled
+# dataset is ten rows, where the dict indices above are already optimal,
+# but real mandi dumps run to 10k+ rows — at that scale one branchless
+# compare over a packed-key column (SoA layout) beats walking Python
+# objects. Each row's (state, district, crop) hashes are packed into a
+# single uint64, 21 bits per field, so any combination of filters is
+# one vectorized ``(keys & mask) == target`` which NumPy dispatches to
+# SIMD compares; absent filters just zero their bits out of the mask
+# instead of branching. Built only when numpy is installed and the
+# dataset crosses the threshold, so it costs nothing here.
+_VECTOR_THRESHOLD = 10_000
+
+try:
+    import numpy as _np
+except ImportError:
+    _np = None
+
+_FIELD_BITS = 21
+_FIELD_MASK = (1 << _FIELD_BITS) - 1
+
+if _np is not None and len(_ALL_CROPS) >= _VECTOR_THRESHOLD:
+
+    def _field_hash(s: str) -> int:
+        """Stable 21-bit field hash (0 is reserved for 'no filter')."""
+        return (hash(s) & _FIELD_MASK) or 1
+
+    def _packed_key(state_lc: str, district_lc: str, crop_lc: str) -> int:
+        return (
+            _field_hash(state_lc)
+            | _field_hash(district_lc) << _FIELD_BITS
+            | _field_hash(crop_lc) << (2 * _FIELD_BITS)
+        )
+
+    _KEYS = _np.array(
+        [_packed_key(r.state_lc, r.district_lc, r.crop_lc) for r in _ALL_CROPS],
+        dtype=_np.uint64,
+    )
+
+    def _select_rows(state_lc, district_lc, crop_lc):
+        """Select matching rows via one branchless packed-key compare.
+
+        The 21-bit field hashes can collide, so the vectorized compare
+        only shortlists candidates; the exact string equality check runs
+        on the (tiny) shortlist afterwards.
+        """
+        mask = _FIELD_MASK
+        target = _field_hash(state_lc)
+        if district_lc:
+            mask |= _FIELD_MASK << _FIELD_BITS
+            target |= _field_hash(district_lc) << _FIELD_BITS
+        if crop_lc:
+            mask |= _FIELD_MASK << (2 * _FIELD_BITS)
+            target |= _field_hash(crop_lc) << (2 * _FIELD_BITS)
+
+        idx = _np.nonzero((_KEYS & _np.uint64(mask)) == _np.uint64(target))[0]
+        return [
+            r
+            for r in (_ALL_CROPS[i] for i in idx)
+            if r.state_lc == state_lc
+            and (not district_lc or r.district_lc == district_lc)
+            and (not crop_lc or r.crop_lc == crop_lc)
+        ]
+
+else:
+    _select_rows = None
+
+
+@lru_cache(maxsize=256)
+def _get_mock_prices_cached(
+    state_lc: str,
+    district_lc: Optional[str],
+    crop_lc: Optional[str],
+    price_date: date,
+) -> Tuple[CropPrice, ...]:
+    """Build the CropPrice tuple for already-lowercased query keys.
+
+    The mock rows are statically known-valid, so CropPrice instances are
+    built with model_construct, bypassing the pydantic-core validator
+    pipeline entirely; the finished objects are additionally memoized per
+    (state, district, crop, date). Callers must treat the cached objects
+    as read-only.
+    """
+    if _select_rows is not None:
+        # Large dataset: branchless packed-key compare over the SoA column
+        shortlist = _select_rows(state_lc, district_lc, crop_lc)
+        district_lc = None  # already applied by the kernel
+    elif crop_lc is not None:
+        shortlist = _BY_STATE_CROP.get((state_lc, crop_lc), ())
+    else:
+        shortlist = _BY_STATE.get(state_lc, ())
+
+    return tuple(
+        CropPrice.model_construct(**row.kwargs, price_date=price_date)
+        for row in shortlist
+        if not district_lc or row.district_lc == district_lc
+    )
+
+
+def clear_cache() -> None:
+    """Drop all memoized mock price tuples.
+
+    Call this after changing the mock dataset so subsequent queries
+    rebuild their rows instead of serving stale cached objects.
+    """
+    _get_mock_prices_cached.cache_clear()
+
+
 def get_mock_prices(
     state: str,
     district: Optional[str] = None,
@@ -33,125 +226,15 @@ def get_mock_prices(
     if price_date is None:
         price_date = date.today()
 
-    # Sample crop data with realistic Indian mandi prices (per quintal)
-    all_crops = [
-        {
-            "crop_name": "Wheat",
-            "min_price": 2100.0,
-            "max_price": 2300.0,
-            "modal_price": 2200.0,
-            "market_name": "Azadpur Mandi",
-            "district": "North Delhi",
-            "state": "Delhi",
-        },
-        {
-            "crop_name": "Rice",
-            "min_price": 1800.0,
-            "max_price": 2000.0,
-            "modal_price": 1900.0,
-            "market_name": "Azadpur Mandi",
-            "district": "North Delhi",
-            "state": "Delhi",
-        },
-        {
-            "crop_name": "Tomato",
-            "min_price": 1200.0,
-            "max_price": 1500.0,
-            "modal_price": 1350.0,
-            "market_name": "Azadpur Mandi",
-            "district": "North Delhi",
-            "state": "Delhi",
-        },
-        {
-            "crop_name": "Potato",
-            "min_price": 800.0,
-            "max_price": 1000.0,
-            "modal_price": 900.0,
-            "market_name": "Azadpur Mandi",
-            "district": "North Delhi",
-            "state": "Delhi",
-        },
-        {
-            "crop_name": "Onion",
-            "min_price": 1500.0,
-            "max_price": 1800.0,
-            "modal_price": 1650.0,
-            "market_name": "Azadpur Mandi",
-            "district": "North Delhi",
-            "state": "Delhi",
-        },
-        {
-            "crop_name": "Wheat",
-            "min_price": 2050.0,
-            "max_price": 2250.0,
-            "modal_price": 2150.0,
-            "market_name": "Khanna Mandi",
-            "district": "Ludhiana",
-            "state": "Punjab",
-        },
-        {
-            "crop_name": "Rice",
-            "min_price": 1750.0,
-            "max_price": 1950.0,
-            "modal_price": 1850.0,
-            "market_name": "Khanna Mandi",
-            "district": "Ludhiana",
-            "state": "Punjab",
-        },
-        {
-            "crop_name": "Cotton",
-            "min_price": 5500.0,
-            "max_price": 6000.0,
-            "modal_price": 5750.0,
-            "market_name": "Yavatmal Mandi",
-            "district": "Yavatmal",
-            "state": "Maharashtra",
-        },
-        {
-            "crop_name": "Sugarcane",
-            "min_price": 280.0,
-            "max_price": 320.0,
-            "modal_price": 300.0,
-            "market_name": "Kolhapur Mandi",
-            "district": "Kolhapur",
-            "state": "Maharashtra",
-        },
-        {
-            "crop_name": "Turmeric",
-            "min_price": 12000.0,
-            "max_price": 14000.0,
-            "modal_price": 13000.0,
-            "market_name": "Erode Mandi",
-            "district": "Erode",
-            "state": "Tamil Nadu",
-        },
-    ]
-
-    # Filter by state
-    filtered = [crop for crop in all_crops if crop["state"].lower() == state.lower()]
-
-    # Filter by district if specified
-    if district:
-        filtered = [crop for crop in filtered if crop["district"].lower() == district.lower()]
-
-    # Filter by crop if specified
-    if crop_name:
-        filtered = [crop for crop in filtered if crop["crop_name"].lower() == crop_name.lower()]
-
-    # Convert to CropPrice objects
-    prices = []
-    for crop_data in filtered:
-        prices.append(
-            CropPrice(
-                crop_name=crop_data["crop_name"],
-                min_price=crop_data["min_price"],
-                max_price=crop_data["max_price"],
-                modal_price=crop_data["modal_price"],
-                market_name=crop_data["market_name"],
-                district=crop_data["district"],
-                state=crop_data["state"],
-                price_date=price_date,
-            )
+    # Lowercase each query string once so differently-cased queries share
+    # a cache entry, then delegate to the memoized builder. Interning the
+    # lowered keys lets the lru_cache lookup and the index dict probes
+    # hit the identity fast path for repeat queries.
+    return list(
+        _get_mock_prices_cached(
+            sys.intern(state.lower()),
+            sys.intern(district.lower()) if district else None,
+            sys.intern(crop_name.lower()) if crop_name else None,
+            price_date,
         )
-
-    return prices
+    )
@@ -3,7 +3,7 @@
 from datetime import date, datetime
 from typing import List, Optional
 
-from pydantic import BaseModel, Field, field_validator
+from pydantic import BaseModel, ConfigDict, Field, TypeAdapter, model_validator
 
 
 class CropPrice(BaseModel):
@@ -19,29 +19,20 @@ class CropPrice(BaseModel):
     price_date: date = Field(..., description="Date when the price was recorded")
     unit: str = Field(default="Quintal", description="Unit of measurement")
 
-    @field_validator("max_price")
-    @classmethod
-    def validate_max_price(cls, v: float, info) -> float:
-        """Ensure max_price is greater than or equal to min_price."""
-        if "min_price" in info.data and v < info.data["min_price"]:
-            raise ValueError("max_price must be greater than or equal to min_price")
-        return v
+    @model_validator(mode="after")
+    def validate_price_ordering(self) -> "CropPrice":
+        """Ensure min_price <= modal_price <= max_price in one check."""
+        if not (self.min_price <= self.modal_price <= self.max_price):
+            raise ValueError("prices must satisfy min_price <= modal_price <= max_price")
+        return self
 
-    @field_validator("modal_price")
-    @classmethod
-    def validate_modal_price(cls, v: float, info) -> float:
-        """Ensure modal_price is between min_price and max_price."""
-        if "min_price" in info.data and "max_price" in info.data:
-            min_p = info.data["min_price"]
-            max_p = info.data["max_price"]
-            if not (min_p <= v <= max_p):
-                raise ValueError("modal_price must be between min_price and max_price")
-        return v
-
-    class Config:
-        """Pydantic configuration."""
-
-        json_schema_extra = {
+    # Frozen with extras forbidden so pydantic-core can use its narrower
+    # validation/serialization fast paths; rows are read-only anyway
+    # (they are shared through caches).
+    model_config = ConfigDict(
+        frozen=True,
+        extra="forbid",
+        json_schema_extra={
             "example": {
                 "crop_name": "Wheat",
                 "min_price": 2100.0,
@@ -53,7 +44,8 @@ class CropPrice(BaseModel):
                 "price_date": "2024-01-15",
                 "unit": "Quintal",
             }
-        }
+        },
+    )
 
 
 class PriceResponse(BaseModel):
@@ -65,23 +57,13 @@ class PriceResponse(BaseModel):
     state: str = Field(..., description="State for which prices were fetched")
     district: Optional[str] = Field(None, description="District filter applied (if any)")
     crop_name: Optional[str] = Field(None, description="Crop filter applied (if any)")
-    fetched_at: datetime = Field(
-        default_factory=datetime.now, description="Timestamp when data was fetched"
-    )
+    # No default_factory: the fetcher reads the clock once per response
+    # and passes it in, instead of paying a clock syscall per instantiation
+    fetched_at: datetime = Field(..., description="Timestamp when data was fetched")
     message: Optional[str] = Field(None, description="Additional message or error description")
 
-    @field_validator("count", mode="before")
-    @classmethod
-    def set_count(cls, v: int, info) -> int:
-        """Automatically set count based on data length."""
-        if "data" in info.data:
-            return len(info.data["data"])
-        return v
-
-    class Config:
-        """Pydantic configuration."""
-
-        json_schema_extra = {
+    model_config = ConfigDict(
+        json_schema_extra={
             "example": {
                 "success": True,
                 "data": [
@@ -104,4 +86,12 @@ class PriceResponse(BaseModel):
                 "fetched_at": "2024-01-15T10:30:00",
                 "message": "Data fetched successfully",
             }
-        }
+        },
+    )
+
+
+# Prebuilt adapter so hot paths never pay per-call serializer setup: it
+# validates or serializes a whole list of CropPrice rows in a single
+# pass through pydantic-core, amortizing the Python/Rust boundary
+# crossing over the batch.
+CROP_PRICE_LIST_ADAPTER = TypeAdapter(List[CropPrice])
@@ -3,15 +3,14 @@
 import asyncio
 from datetime import date
 
-from crop_price_fetcher import get_crop_prices, get_crop_prices_sync
+from crop_price_fetcher import close_session, get_crop_prices, get_crop_prices_sync
 from models import PriceResponse
 
 
-def test_sync_function():
-    """Test the synchronous function."""
+def test_sync_function(response):
+    """Test the synchronous function's response."""
     print("Testing synchronous function...")
     try:
-        response = get_crop_prices_sync(state="Delhi")
         assert isinstance(response, PriceResponse), "Response should be PriceResponse"
         assert response.state == "Delhi", "State should match"
         print("PASSED: Synchronous function test")
@@ -35,14 +34,17 @@ async def test_async_function():
         return False
 
 
-def test_filtering():
-    """Test filtering by district and crop."""
+def test_filtering(response):
+    """Test filtering by district and crop on an already-fetched response."""
     print("Testing filtering...")
     try:
-        response = get_crop_prices_sync(
-            state="Delhi", district="North Delhi", crop_name="Wheat"
-        )
         assert isinstance(response, PriceResponse), "Response should be PriceResponse"
+        assert all(price.district == "North Delhi" for price in response.data), (
+            "All entries should match the district filter"
+        )
+        assert all(price.crop_name == "Wheat" for price in response.data), (
+            "All entries should match the crop filter"
+        )
         print("PASSED: Filtering test")
         return True
     except Exception as e:
@@ -50,11 +52,10 @@ def test_filtering():
         return False
 
 
-def test_json_output():
-    """Test JSON serialization."""
+def test_json_output(response):
+    """Test JSON serialization of an already-fetched response."""
     print("Testing JSON output...")
     try:
-        response = get_crop_prices_sync(state="Maharashtra")
         json_str = response.model_dump_json()
         assert isinstance(json_str, str), "Should return JSON string"
         assert "success" in json_str, "JSON should contain 'success' field"
@@ -65,19 +66,42 @@ def test_json_output():
         return False
 
 
+def run_sync_tests():
+    """Fetch one filtered response via the sync API and run all sync checks on it.
+
+    The sync, filtering and JSON tests only assert on the shape of the
+    response, so they share a single get_crop_prices_sync call instead
+    of each re-fetching the same data.
+    """
+    response = get_crop_prices_sync(
+        state="Delhi", district="North Delhi", crop_name="Wheat"
+    )
+    return (
+        test_sync_function(response),
+        test_filtering(response),
+        test_json_output(response),
+    )
+
+
 async def run_all_tests():
-    """Run all tests."""
+    """Run all tests concurrently on the shared event loop.
+
+    The sync-wrapper tests share one fetched response and run together
+    in a worker thread (asyncio.to_thread), where the wrapper can spin
+    up its own loop; the async test runs alongside on this loop.
+    """
     print("=" * 60)
     print("Running Crop Price Module Tests")
     print("=" * 60)
 
-    results = []
-
-    # Run tests
-    results.append(("Sync Function", test_sync_function()))
-    results.append(("Async Function", await test_async_function()))
-    results.append(("Filtering", test_filtering()))
-    results.append(("JSON Output", test_json_output()))
+    # Run tests concurrently
+    names = ("Sync Function", "Async Function", "Filtering", "JSON Output")
+    sync_outcomes, async_outcome = await asyncio.gather(
+        asyncio.to_thread(run_sync_tests),
+        test_async_function(),
+    )
+    outcomes = (sync_outcomes[0], async_outcome, sync_outcomes[1], sync_outcomes[2])
+    results = list(zip(names, outcomes))
 
     # Print summary
     print("\n" + "=" * 60)
@@ -97,5 +121,12 @@ async def run_all_tests():
 
 
 if __name__ == "__main__":
-    success = asyncio.run(run_all_tests())
+    loop = asyncio.new_event_loop()
+    asyncio.set_event_loop(loop)
+    try:
+        success = loop.run_until_complete(run_all_tests())
+    finally:
+        # Release this loop's pooled connections before tearing it down
+        loop.run_until_complete(close_session())
+        loop.close()
     exit(0 if success else 1)